@@ -15,6 +15,17 @@ All results are generated using the history-based mode except for cases e01 to e
 
 All results are visually verified using the '_visualize.py' script in the regression test folder.
 
+Each case runs in its own folder, so the cases can be distributed over several processes
+with pytest-xdist, e.g. 'pytest -n auto tests/regression_tests/surface_source_write'.
+The number of OMP threads is still set per case so that the workers do not oversubscribe
+the available cores.
+
+Setting the OPENMC_PARALLEL_TESTS environment variable to 1 runs the history-based cases
+concurrently in a pool of processes within a single test instead of one test per case.
+
+Setting the OPENMC_TEST_CACHE environment variable to 1 caches the output files of each
+case in '~/.cache/openmc-tests' to reuse them in the following sessions.
+
 OpenMC models
 -------------
 
@@ -134,12 +145,20 @@ TODO:
 
 """
 
+import copy
+import functools
+import hashlib
+import multiprocessing
+import operator
 import os
 import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import h5py
 import numpy as np
+from numpy.lib.recfunctions import repack_fields, structured_to_unstructured
 import openmc
 import openmc.lib
 import pytest
@@ -150,10 +169,22 @@ from tests.regression_tests import config
 
 @pytest.fixture(scope="function")
 def single_thread(monkeypatch):
-    """Set the number of OMP threads to 1 for the test."""
+    """Set the number of OMP threads to 1 for the test.
+
+    This also prevents oversubscription when the cases are distributed over
+    several pytest-xdist workers.
+
+    """
     monkeypatch.setenv("OMP_NUM_THREADS", "1")
 
 
+@pytest.fixture(autouse=True)
+def no_hdf5_file_locking(monkeypatch):
+    """Disable HDF5 file locking for the OpenMC runs of the test, as the
+    nuclear data files are only read by the cases."""
+    monkeypatch.setenv("HDF5_USE_FILE_LOCKING", "FALSE")
+
+
 @pytest.fixture(scope="function")
 def two_threads(monkeypatch):
     """Set the number of OMP threads to 2 for the test."""
@@ -166,20 +197,24 @@ def single_process(monkeypatch):
     monkeypatch.setitem(config, "mpi_np", "1")
 
 
-@pytest.fixture(scope="module")
-def model_1():
-    """Cylindrical core contained in a first box which is contained in a larger box.
-    A lower universe is used to describe the interior of the first box which
-    contains the core and its surrounding space.
+# Parameters of the cylindrical core shared by the CSG-only models
+CORE_RADIUS = 2.0
+CORE_HEIGHT = 4.0
+CORE_BOUNDS = [
+    -CORE_RADIUS,
+    -CORE_RADIUS,
+    -CORE_HEIGHT / 2.0,
+    CORE_RADIUS,
+    CORE_RADIUS,
+    CORE_HEIGHT / 2.0,
+]
 
-    """
-    openmc.reset_auto_ids()
-    model = openmc.Model()
+# Spatial distribution of the source of the CSG-only models
+CORE_BOX = openmc.stats.Box(CORE_BOUNDS[:3], CORE_BOUNDS[3:])
 
-    # =============================================================================
-    # Materials
-    # =============================================================================
 
+def _make_fuel_water():
+    """Create the fuel and water materials of the CSG-only models."""
     fuel = openmc.Material()
     fuel.add_nuclide("U234", 0.0004524)
     fuel.add_nuclide("U235", 0.0506068)
@@ -193,22 +228,18 @@ def model_1():
     water.add_nuclide("O16", 1.0)
     water.set_density("g/cm3", 1.0)
 
-    # =============================================================================
-    # Geometry
-    # =============================================================================
+    return fuel, water
 
-    # -----------------------------------------------------------------------------
-    # Cylindrical core
-    # -----------------------------------------------------------------------------
 
-    # Parameters
-    core_radius = 2.0
-    core_height = 4.0
+def _make_core_universe(fuel, water):
+    """Create the universe describing the cylindrical core and its
+    surrounding space, used to fill the first box of the CSG-only models.
 
+    """
     # Surfaces
-    core_cylinder = openmc.ZCylinder(r=core_radius)
-    core_lower_plane = openmc.ZPlane(-core_height / 2.0)
-    core_upper_plane = openmc.ZPlane(core_height / 2.0)
+    core_cylinder = openmc.ZCylinder(r=CORE_RADIUS)
+    core_lower_plane = openmc.ZPlane(-CORE_HEIGHT / 2.0)
+    core_upper_plane = openmc.ZPlane(CORE_HEIGHT / 2.0)
 
     # Region
     core_region = -core_cylinder & +core_lower_plane & -core_upper_plane
@@ -218,8 +249,50 @@ def model_1():
     outside_core_region = +core_cylinder | -core_lower_plane | +core_upper_plane
     outside_core = openmc.Cell(fill=water, region=outside_core_region)
 
-    # Universe
-    inside_box1_universe = openmc.Universe(cells=[core, outside_core])
+    return openmc.Universe(cells=[core, outside_core])
+
+
+def _make_settings():
+    """Create the settings of the CSG-only models with a source sampled
+    in the fissionable region of the cylindrical core.
+
+    """
+    settings = openmc.Settings()
+    settings.particles = 100
+    settings.batches = 5
+    settings.inactive = 1
+    settings.seed = 1
+    settings.source = openmc.IndependentSource(
+        space=CORE_BOX, constraints={'fissionable': True})
+
+    return settings
+
+
+@pytest.fixture(scope="module")
+def model_1():
+    """Cylindrical core contained in a first box which is contained in a larger box.
+    A lower universe is used to describe the interior of the first box which
+    contains the core and its surrounding space.
+
+    """
+    openmc.reset_auto_ids()
+    model = openmc.Model()
+
+    # =============================================================================
+    # Materials
+    # =============================================================================
+
+    fuel, water = _make_fuel_water()
+
+    # =============================================================================
+    # Geometry
+    # =============================================================================
+
+    # -----------------------------------------------------------------------------
+    # Cylindrical core
+    # -----------------------------------------------------------------------------
+
+    inside_box1_universe = _make_core_universe(fuel, water)
 
     # -----------------------------------------------------------------------------
     # Box 1
@@ -263,34 +336,25 @@ def model_1():
     # Settings
     # =============================================================================
 
-    model.settings = openmc.Settings()
-    model.settings.particles = 100
-    model.settings.batches = 5
-    model.settings.inactive = 1
-    model.settings.seed = 1
-
-    bounds = [
-        -core_radius,
-        -core_radius,
-        -core_height / 2.0,
-        core_radius,
-        core_radius,
-        core_height / 2.0,
-    ]
-    distribution = openmc.stats.Box(bounds[:3], bounds[3:])
-    model.settings.source = openmc.IndependentSource(
-        space=distribution, constraints={'fissionable': True})
+    model.settings = _make_settings()
 
     return model
 
 
-@pytest.fixture
-def model_2():
-    """Cylindrical core contained in a box.
+def _make_box1_model(boundary_type):
+    """Create a model with the cylindrical core contained in a box.
     A lower universe is used to describe the interior of the box which
     contains the core and its surrounding space.
 
-    The box is defined with vacuum boundary conditions.
+    Parameters
+    ----------
+    boundary_type : str
+        Boundary conditions of the box
+
+    Returns
+    -------
+    openmc.Model
+        Model of the cylindrical core contained in a box
 
     """
     openmc.reset_auto_ids()
@@ -300,18 +364,7 @@ def model_2():
     # Materials
     # =============================================================================
 
-    fuel = openmc.Material()
-    fuel.add_nuclide("U234", 0.0004524)
-    fuel.add_nuclide("U235", 0.0506068)
-    fuel.add_nuclide("U238", 0.9487090)
-    fuel.add_nuclide("U236", 0.0002318)
-    fuel.add_nuclide("O16", 2.0)
-    fuel.set_density("g/cm3", 11.0)
-
-    water = openmc.Material()
-    water.add_nuclide("H1", 2.0)
-    water.add_nuclide("O16", 1.0)
-    water.set_density("g/cm3", 1.0)
+    fuel, water = _make_fuel_water()
 
     # =============================================================================
     # Geometry
@@ -321,25 +374,7 @@ def model_2():
     # Cylindrical core
     # -----------------------------------------------------------------------------
 
-    # Parameters
-    core_radius = 2.0
-    core_height = 4.0
-
-    # Surfaces
-    core_cylinder = openmc.ZCylinder(r=core_radius)
-    core_lower_plane = openmc.ZPlane(-core_height / 2.0)
-    core_upper_plane = openmc.ZPlane(core_height / 2.0)
-
-    # Region
-    core_region = -core_cylinder & +core_lower_plane & -core_upper_plane
-
-    # Cells
-    core = openmc.Cell(fill=fuel, region=core_region)
-    outside_core_region = +core_cylinder | -core_lower_plane | +core_upper_plane
-    outside_core = openmc.Cell(fill=water, region=outside_core_region)
-
-    # Universe
-    inside_box1_universe = openmc.Universe(cells=[core, outside_core])
+    inside_box1_universe = _make_core_universe(fuel, water)
 
     # -----------------------------------------------------------------------------
     # Box 1
@@ -353,7 +388,7 @@ def model_2():
         -box1_size / 2.0, box1_size / 2.0,
         -box1_size / 2.0, box1_size / 2.0,
         -box1_size / 2.0, box1_size / 2.0,
-        boundary_type="vacuum"
+        boundary_type=boundary_type
     )
 
     # Cell
@@ -366,131 +401,36 @@ def model_2():
     # Settings
     # =============================================================================
 
-    model.settings = openmc.Settings()
-    model.settings.particles = 100
-    model.settings.batches = 5
-    model.settings.inactive = 1
-    model.settings.seed = 1
-
-    bounds = [
-        -core_radius,
-        -core_radius,
-        -core_height / 2.0,
-        core_radius,
-        core_radius,
-        core_height / 2.0,
-    ]
-    distribution = openmc.stats.Box(bounds[:3], bounds[3:])
-    model.settings.source = openmc.IndependentSource(
-        space=distribution, constraints={'fissionable': True})
+    model.settings = _make_settings()
 
     return model
 
 
-@pytest.fixture
-def model_3():
+@pytest.fixture(scope="module")
+def model_2():
     """Cylindrical core contained in a box.
     A lower universe is used to describe the interior of the box which
     contains the core and its surrounding space.
 
-    The box is defined with reflective boundary conditions.
+    The box is defined with vacuum boundary conditions.
 
     """
-    openmc.reset_auto_ids()
-    model = openmc.Model()
+    return _make_box1_model("vacuum")
 
-    # =============================================================================
-    # Materials
-    # =============================================================================
-
-    fuel = openmc.Material()
-    fuel.add_nuclide("U234", 0.0004524)
-    fuel.add_nuclide("U235", 0.0506068)
-    fuel.add_nuclide("U238", 0.9487090)
-    fuel.add_nuclide("U236", 0.0002318)
-    fuel.add_nuclide("O16", 2.0)
-    fuel.set_density("g/cm3", 11.0)
-
-    water = openmc.Material()
-    water.add_nuclide("H1", 2.0)
-    water.add_nuclide("O16", 1.0)
-    water.set_density("g/cm3", 1.0)
-
-    # =============================================================================
-    # Geometry
-    # =============================================================================
-
-    # -----------------------------------------------------------------------------
-    # Cylindrical core
-    # -----------------------------------------------------------------------------
 
-    # Parameters
-    core_radius = 2.0
-    core_height = 4.0
-
-    # Surfaces
-    core_cylinder = openmc.ZCylinder(r=core_radius)
-    core_lower_plane = openmc.ZPlane(-core_height / 2.0)
-    core_upper_plane = openmc.ZPlane(core_height / 2.0)
-
-    # Region
-    core_region = -core_cylinder & +core_lower_plane & -core_upper_plane
-
-    # Cells
-    core = openmc.Cell(fill=fuel, region=core_region)
-    outside_core_region = +core_cylinder | -core_lower_plane | +core_upper_plane
-    outside_core = openmc.Cell(fill=water, region=outside_core_region)
-
-    # Universe
-    inside_box1_universe = openmc.Universe(cells=[core, outside_core])
-
-    # -----------------------------------------------------------------------------
-    # Box 1
-    # -----------------------------------------------------------------------------
-
-    # Parameters
-    box1_size = 6.0
-
-    # Surfaces
-    box1_rpp = openmc.model.RectangularParallelepiped(
-        -box1_size / 2.0, box1_size / 2.0,
-        -box1_size / 2.0, box1_size / 2.0,
-        -box1_size / 2.0, box1_size / 2.0,
-        boundary_type="reflective"
-    )
-
-    # Cell
-    box1 = openmc.Cell(fill=inside_box1_universe, region=-box1_rpp)
-
-    # Register geometry
-    model.geometry = openmc.Geometry([box1])
-
-    # =============================================================================
-    # Settings
-    # =============================================================================
-
-    model.settings = openmc.Settings()
-    model.settings.particles = 100
-    model.settings.batches = 5
-    model.settings.inactive = 1
-    model.settings.seed = 1
+@pytest.fixture(scope="module")
+def model_3():
+    """Cylindrical core contained in a box.
+    A lower universe is used to describe the interior of the box which
+    contains the core and its surrounding space.
 
-    bounds = [
-        -core_radius,
-        -core_radius,
-        -core_height / 2.0,
-        core_radius,
-        core_radius,
-        core_height / 2.0,
-    ]
-    distribution = openmc.stats.Box(bounds[:3], bounds[3:])
-    model.settings.source = openmc.IndependentSource(
-        space=distribution, constraints={'fissionable': True})
+    The box is defined with reflective boundary conditions.
 
-    return model
+    """
+    return _make_box1_model("reflective")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def model_4():
     """Cylindrical core contained in a box.
     A lower universe is used to describe the interior of the box which
@@ -507,18 +447,7 @@ def model_4():
     # Materials
     # =============================================================================
 
-    fuel = openmc.Material()
-    fuel.add_nuclide("U234", 0.0004524)
-    fuel.add_nuclide("U235", 0.0506068)
-    fuel.add_nuclide("U238", 0.9487090)
-    fuel.add_nuclide("U236", 0.0002318)
-    fuel.add_nuclide("O16", 2.0)
-    fuel.set_density("g/cm3", 11.0)
-
-    water = openmc.Material()
-    water.add_nuclide("H1", 2.0)
-    water.add_nuclide("O16", 1.0)
-    water.set_density("g/cm3", 1.0)
+    fuel, water = _make_fuel_water()
 
     # =============================================================================
     # Geometry
@@ -528,25 +457,7 @@ def model_4():
     # Cylindrical core
     # -----------------------------------------------------------------------------
 
-    # Parameters
-    core_radius = 2.0
-    core_height = 4.0
-
-    # Surfaces
-    core_cylinder = openmc.ZCylinder(r=core_radius)
-    core_lower_plane = openmc.ZPlane(-core_height / 2.0)
-    core_upper_plane = openmc.ZPlane(core_height / 2.0)
-
-    # Region
-    core_region = -core_cylinder & +core_lower_plane & -core_upper_plane
-
-    # Cells
-    core = openmc.Cell(fill=fuel, region=core_region)
-    outside_core_region = +core_cylinder | -core_lower_plane | +core_upper_plane
-    outside_core = openmc.Cell(fill=water, region=outside_core_region)
-
-    # Universe
-    inside_box1_universe = openmc.Universe(cells=[core, outside_core])
+    inside_box1_universe = _make_core_universe(fuel, water)
 
     # -----------------------------------------------------------------------------
     # Box 1
@@ -583,29 +494,25 @@ def model_4():
     # Settings
     # =============================================================================
 
-    model.settings = openmc.Settings()
-    model.settings.particles = 100
-    model.settings.batches = 5
-    model.settings.inactive = 1
-    model.settings.seed = 1
-
-    bounds = [
-        -core_radius,
-        -core_radius,
-        -core_height / 2.0,
-        core_radius,
-        core_radius,
-        core_height / 2.0,
-    ]
-    distribution = openmc.stats.Box(bounds[:3], bounds[3:])
-    model.settings.source = openmc.IndependentSource(
-        space=distribution, constraints={'fissionable': True})
+    model.settings = _make_settings()
 
     return model
 
 
+def _read_source_bank(filepath):
+    """Read the source bank of a surface source file with a single
+    read into a preallocated structured array.
+
+    """
+    with h5py.File(filepath, "r") as f:
+        dataset = f["source_bank"]
+        arr = np.empty(dataset.shape, dtype=dataset.dtype)
+        dataset.read_direct(arr)
+    return arr
+
+
 def return_surface_source_data(filepath):
-    """Read a surface source file and return a sorted array composed
+    """Read a surface source file and return sorted arrays composed
     of flatten arrays of source data for each surface source point.
 
     TODO:
@@ -620,87 +527,176 @@ def return_surface_source_data(filepath):
 
     Returns
     -------
-    data : np.array
-        Sorted array composed of flatten arrays of source data for
-        each surface source point
+    float_data : np.array
+        Sorted array composed of the position, direction, energy, time and
+        weight of each surface source point
+    int_data : np.array
+        Sorted array composed of the delayed group, surface ID and particle
+        type of each surface source point
 
     """
-    data = []
-    keys = []
+    arr = _read_source_bank(filepath)
+
+    float_data = np.empty((len(arr), 9), dtype=np.float64)
+    float_data[:, 0:3] = structured_to_unstructured(arr["r"])
+    float_data[:, 3:6] = structured_to_unstructured(arr["u"])
+    float_data[:, 6] = arr["E"]
+    float_data[:, 7] = arr["time"]
+    float_data[:, 8] = arr["wgt"]
+
+    int_data = np.empty((len(arr), 3), dtype=np.int64)
+    int_data[:, 0] = arr["delayed_group"]
+    int_data[:, 1] = arr["surf_id"]
+    int_data[:, 2] = arr["particle"]
+
+    # Sort the points by position first, then by direction, energy, time,
+    # weight, delayed group, surface and particle type. np.lexsort uses the
+    # last key as the primary one, hence the reversed order of the columns.
+    sorted_idx = np.lexsort((*int_data.T[::-1], *float_data.T[::-1]))
+
+    return float_data[sorted_idx], int_data[sorted_idx]
+
+
+def return_surface_source_digest(filepath):
+    """Return the SHA-256 digest of the source bank of a surface source file.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the surface source file
+
+    Returns
+    -------
+    str
+        Hexadecimal digest of the source bank
+
+    """
+    arr = _read_source_bank(filepath)
+
+    # Remove the padding bytes of the compound type, which are not
+    # guaranteed to be initialized, before hashing the raw data
+    return hashlib.sha256(repack_fields(arr).tobytes()).hexdigest()
+
+
+# Whether to reuse the results cached by previous sessions
+TEST_CACHE = os.environ.get("OPENMC_TEST_CACHE") == "1"
+TEST_CACHE_DIR = Path.home() / ".cache" / "openmc-tests"
+
+# Output files reused from the cache instead of running OpenMC again
+CACHED_OUTPUTS = ("statepoint.5.h5", "surface_source.h5")
+
+DAGMC_FILE = Path(__file__).parent / "../dagmc/legacy/dagmc.h5m"
 
-    # Read source file
-    with h5py.File(filepath, "r") as f:
-        for point in f["source_bank"]:
-            r = point["r"]
-            u = point["u"]
-            e = point["E"]
-            time = point["time"]
-            wgt = point["wgt"]
-            delayed_group = point["delayed_group"]
-            surf_id = point["surf_id"]
-            particle = point["particle"]
-
-            key = (
-                f"{r[0]:.10e} {r[1]:.10e} {r[2]:.10e} {u[0]:.10e} {u[1]:.10e} {u[2]:.10e}"
-                f"{e:.10e} {time:.10e} {wgt:.10e} {delayed_group} {surf_id} {particle}"
-            )
 
-            keys.append(key)
+def _file_identity(path):
+    """Return the path, size and modification time of a file."""
+    path = os.path.realpath(path)
+    stat = os.stat(path)
+    return f"{path}:{stat.st_size}:{stat.st_mtime_ns}"
 
-            values = [*r, *u, e, time, wgt, delayed_group, surf_id, particle]
-            assert len(values) == 12
-            data.append(values)
 
-    data = np.array(data)
-    keys = np.array(keys)
-    sorted_idx = np.argsort(keys)
+def _cache_identity():
+    """Return the identity of the files used by the cases besides model.xml,
+    or None if the OpenMC executable cannot be found.
 
-    return data[sorted_idx]
+    The version of OpenMC does not change between the builds of a development
+    tree, so the OpenMC executable and shared library themselves identify the
+    code under test. The DAGMC file and the cross section library, if set
+    through OPENMC_CROSS_SECTIONS, are also part of the identity.
+
+    """
+    exe = shutil.which(config["exe"])
+    if exe is None:
+        return None
+    paths = [exe, str(openmc.lib._filename), DAGMC_FILE]
+    if "OPENMC_CROSS_SECTIONS" in os.environ:
+        paths.append(os.environ["OPENMC_CROSS_SECTIONS"])
+    return "\n".join(_file_identity(path) for path in paths)
 
 
 class SurfaceSourceWriteTestHarness(PyAPITestHarness):
-    def __init__(self, statepoint_name, model=None, inputs_true=None, workdir=None):
-        super().__init__(statepoint_name, model, inputs_true)
-        self.workdir = workdir
+    def _run_openmc(self):
+        """Run OpenMC, reusing the output files of a previous run of the same
+        inputs if OPENMC_TEST_CACHE is set to 1.
+
+        The output files are stored in a persistent cache directory, keyed by
+        the content of model.xml, the version of OpenMC, the OpenMC executable
+        and shared library, the DAGMC file, the cross section library, the
+        number of threads and the transport mode. The cache is never used when
+        the results or inputs are being updated.
+
+        """
+        if TEST_CACHE and not (config["update"] or config["build_inputs"]):
+            identity = _cache_identity()
+        else:
+            identity = None
+        if identity is None:
+            super()._run_openmc()
+            return
+
+        with open(self._path("model.xml"), "rb") as fh:
+            key = hashlib.sha256(
+                fh.read()
+                + openmc.__version__.encode()
+                + identity.encode()
+                + os.environ.get("OMP_NUM_THREADS", "").encode()
+                + str(config["event"]).encode()
+            ).hexdigest()
+        cache_dir = TEST_CACHE_DIR / "sp" / key
+
+        # Entries are only created complete, see below
+        if cache_dir.is_dir():
+            for name in CACHED_OUTPUTS:
+                shutil.copyfile(cache_dir / name, self._path(name))
+            return
+
+        super()._run_openmc()
+        if all(os.path.exists(self._path(name)) for name in CACHED_OUTPUTS):
+            # Fill a temporary directory and move it into place so that an
+            # interrupted or concurrent session never leaves a partial entry
+            cache_dir.parent.mkdir(parents=True, exist_ok=True)
+            tmp_dir = tempfile.mkdtemp(dir=cache_dir.parent, prefix=".tmp-")
+            try:
+                for name in CACHED_OUTPUTS:
+                    shutil.copyfile(self._path(name), os.path.join(tmp_dir, name))
+                os.replace(tmp_dir, cache_dir)
+            except OSError:
+                # Another session has already filled the entry
+                if not cache_dir.is_dir():
+                    raise
+            finally:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
 
     def _test_output_created(self):
         """Make sure surface_source.h5 has also been created."""
         super()._test_output_created()
         if self._model.settings.surf_source_write:
             assert os.path.exists(
-                "surface_source.h5"
+                self._path("surface_source.h5")
             ), "Surface source file has not been created."
 
     def _compare_output(self):
         """Compare surface_source.h5 files."""
         if self._model.settings.surf_source_write:
-            source_true = return_surface_source_data("surface_source_true.h5")
-            source_test = return_surface_source_data("surface_source.h5")
-            np.testing.assert_allclose(source_true, source_test, rtol=1e-07)
-
-    def main(self):
-        """Accept commandline arguments and either run or update tests."""
-        if config["build_inputs"]:
-            self.build_inputs()
-        elif config["update"]:
-            self.update_results()
-        else:
-            self.execute_test()
-
-    def build_inputs(self):
-        """Build inputs."""
-        base_dir = os.getcwd()
-        try:
-            os.chdir(self.workdir)
-            self._build_inputs()
-        finally:
-            os.chdir(base_dir)
+            # Skip the point-by-point comparison if the source banks are identical
+            path_true = self._path("surface_source_true.h5")
+            path_test = self._path("surface_source.h5")
+            digest_true = return_surface_source_digest(path_true)
+            digest_test = return_surface_source_digest(path_test)
+            if digest_true == digest_test:
+                return
+            float_true, int_true = return_surface_source_data(path_true)
+            float_test, int_test = return_surface_source_data(path_test)
+            # Only produce the detailed mismatch report on failure
+            if float_true.shape != float_test.shape or not np.allclose(
+                float_true, float_test, rtol=1e-07, atol=0.0
+            ):
+                np.testing.assert_allclose(float_true, float_test, rtol=1e-07)
+            assert np.array_equal(int_true, int_test)
 
     def execute_test(self):
         """Build inputs, run OpenMC, and verify correct results."""
-        base_dir = os.getcwd()
         try:
-            os.chdir(self.workdir)
             self._build_inputs()
             inputs = self._get_inputs()
             self._write_inputs(inputs)
@@ -713,119 +709,107 @@ class SurfaceSourceWriteTestHarness(PyAPITestHarness):
             self._compare_results()
         finally:
             self._cleanup()
-            os.chdir(base_dir)
-
-    def update_results(self):
-        """Update results_true.dat and inputs_true.dat"""
-        base_dir = os.getcwd()
-        try:
-            os.chdir(self.workdir)
-            self._build_inputs()
-            inputs = self._get_inputs()
-            self._write_inputs(inputs)
-            self._overwrite_inputs()
-            self._run_openmc()
-            self._test_output_created()
-            results = self._get_results()
-            self._write_results(results)
-            self._overwrite_results()
-        finally:
-            self._cleanup()
-            os.chdir(base_dir)
 
     def _overwrite_results(self):
         """Also add the 'surface_source.h5' file during overwriting."""
         super()._overwrite_results()
-        if os.path.exists("surface_source.h5"):
-            shutil.copyfile("surface_source.h5", "surface_source_true.h5")
+        if os.path.exists(self._path("surface_source.h5")):
+            shutil.copyfile(
+                self._path("surface_source.h5"), self._path("surface_source_true.h5")
+            )
 
     def _cleanup(self):
         """Also remove the 'surface_source.h5' file while cleaning."""
         super()._cleanup()
-        fs = "surface_source.h5"
+        fs = self._path("surface_source.h5")
         if os.path.exists(fs):
             os.remove(fs)
 
 
+# Cases for CSG-only geometries run in history-based mode
+HISTORY_BASED_CASES = [
+    ("case-01", "model_1", {"max_particles": 300}),
+    ("case-02", "model_1", {"max_particles": 300, "surface_ids": [8]}),
+    (
+        "case-03",
+        "model_1",
+        {"max_particles": 300, "surface_ids": [4, 5, 6, 7, 8, 9]},
+    ),
+    (
+        "case-04",
+        "model_1",
+        {"max_particles": 300, "surface_ids": [4, 5, 6, 7, 8, 9], "cell": 2},
+    ),
+    (
+        "case-05",
+        "model_1",
+        {"max_particles": 300, "surface_ids": [4, 5, 6, 7, 8, 9], "cell": 3},
+    ),
+    ("case-06", "model_1", {"max_particles": 300, "cell": 2}),
+    ("case-07", "model_1", {"max_particles": 300, "cell": 3}),
+    ("case-08", "model_1", {"max_particles": 300, "cellfrom": 2}),
+    ("case-09", "model_1", {"max_particles": 300, "cellto": 2}),
+    ("case-10", "model_1", {"max_particles": 300, "cellfrom": 3}),
+    ("case-11", "model_1", {"max_particles": 300, "cellto": 3}),
+    (
+        "case-12",
+        "model_2",
+        {"max_particles": 300, "surface_ids": [4, 5, 6, 7, 8, 9]},
+    ),
+    (
+        "case-13",
+        "model_2",
+        {"max_particles": 300, "surface_ids": [4, 5, 6, 7, 8, 9], "cell": 3},
+    ),
+    (
+        "case-14",
+        "model_2",
+        {"max_particles": 300, "surface_ids": [4, 5, 6, 7, 8, 9], "cellfrom": 3},
+    ),
+    (
+        "case-15",
+        "model_2",
+        {"max_particles": 300, "surface_ids": [4, 5, 6, 7, 8, 9], "cellto": 3},
+    ),
+    (
+        "case-16",
+        "model_3",
+        {"max_particles": 300, "surface_ids": [4, 5, 6, 7, 8, 9]},
+    ),
+    (
+        "case-17",
+        "model_3",
+        {"max_particles": 300, "surface_ids": [4, 5, 6, 7, 8, 9], "cell": 3},
+    ),
+    (
+        "case-18",
+        "model_3",
+        {"max_particles": 300, "surface_ids": [4, 5, 6, 7, 8, 9], "cellfrom": 3},
+    ),
+    (
+        "case-19",
+        "model_3",
+        {"max_particles": 300, "surface_ids": [4, 5, 6, 7, 8, 9], "cellto": 3},
+    ),
+    (
+        "case-20",
+        "model_4",
+        {"max_particles": 300, "surface_ids": [4]},
+    ),
+    (
+        "case-21",
+        "model_4",
+        {"max_particles": 300, "surface_ids": [4], "cell": 3},
+    ),
+]
+
+# Whether to run the history-based cases concurrently within a single test
+PARALLEL_CASES = os.environ.get("OPENMC_PARALLEL_TESTS") == "1"
+
+
 @pytest.mark.skipif(config["event"] is True, reason="Results from history-based mode.")
-@pytest.mark.parametrize(
-    "folder, model_name, parameter",
-    [
-        ("case-01", "model_1", {"max_particles": 300}),
-        ("case-02", "model_1", {"max_particles": 300, "surface_ids": [8]}),
-        (
-            "case-03",
-            "model_1",
-            {"max_particles": 300, "surface_ids": [4, 5, 6, 7, 8, 9]},
-        ),
-        (
-            "case-04",
-            "model_1",
-            {"max_particles": 300, "surface_ids": [4, 5, 6, 7, 8, 9], "cell": 2},
-        ),
-        (
-            "case-05",
-            "model_1",
-            {"max_particles": 300, "surface_ids": [4, 5, 6, 7, 8, 9], "cell": 3},
-        ),
-        ("case-06", "model_1", {"max_particles": 300, "cell": 2}),
-        ("case-07", "model_1", {"max_particles": 300, "cell": 3}),
-        ("case-08", "model_1", {"max_particles": 300, "cellfrom": 2}),
-        ("case-09", "model_1", {"max_particles": 300, "cellto": 2}),
-        ("case-10", "model_1", {"max_particles": 300, "cellfrom": 3}),
-        ("case-11", "model_1", {"max_particles": 300, "cellto": 3}),
-        (
-            "case-12",
-            "model_2",
-            {"max_particles": 300, "surface_ids": [4, 5, 6, 7, 8, 9]},
-        ),
-        (
-            "case-13",
-            "model_2",
-            {"max_particles": 300, "surface_ids": [4, 5, 6, 7, 8, 9], "cell": 3},
-        ),
-        (
-            "case-14",
-            "model_2",
-            {"max_particles": 300, "surface_ids": [4, 5, 6, 7, 8, 9], "cellfrom": 3},
-        ),
-        (
-            "case-15",
-            "model_2",
-            {"max_particles": 300, "surface_ids": [4, 5, 6, 7, 8, 9], "cellto": 3},
-        ),
-        (
-            "case-16",
-            "model_3",
-            {"max_particles": 300, "surface_ids": [4, 5, 6, 7, 8, 9]},
-        ),
-        (
-            "case-17",
-            "model_3",
-            {"max_particles": 300, "surface_ids": [4, 5, 6, 7, 8, 9], "cell": 3},
-        ),
-        (
-            "case-18",
-            "model_3",
-            {"max_particles": 300, "surface_ids": [4, 5, 6, 7, 8, 9], "cellfrom": 3},
-        ),
-        (
-            "case-19",
-            "model_3",
-            {"max_particles": 300, "surface_ids": [4, 5, 6, 7, 8, 9], "cellto": 3},
-        ),
-        (
-            "case-20",
-            "model_4",
-            {"max_particles": 300, "surface_ids": [4]},
-        ),
-        (
-            "case-21",
-            "model_4",
-            {"max_particles": 300, "surface_ids": [4], "cell": 3},
-        ),
-    ],
-)
+@pytest.mark.skipif(PARALLEL_CASES, reason="Cases are run in parallel.")
+@pytest.mark.parametrize("folder, model_name, parameter", HISTORY_BASED_CASES)
 def test_surface_source_cell_history_based(
     folder, model_name, parameter, single_thread, single_process, request
 ):
@@ -840,6 +824,65 @@ def test_surface_source_cell_history_based(
     harness.main()
 
 
+# Harnesses of the cases run by the worker processes of the pool
+_worker_harnesses = []
+
+
+def _init_worker(harnesses):
+    """Store the harnesses inherited by a forked worker process."""
+    _worker_harnesses[:] = harnesses
+
+
+def _run_case(index):
+    """Run the case of the given index in a worker process."""
+    _worker_harnesses[index].main()
+
+
+@pytest.mark.skipif(config["event"] is True, reason="Results from history-based mode.")
+@pytest.mark.skipif(not PARALLEL_CASES, reason="OPENMC_PARALLEL_TESTS is not set to 1.")
+def test_surface_source_cell_history_based_parallel(
+    single_thread, single_process, request
+):
+    """Test on history-based results for CSG-only geometries with the cases
+    distributed over a pool of processes.
+
+    Each case runs in its own folder and on its own copy of the model. The
+    harnesses are inherited by the forked worker processes, as the models
+    cannot be pickled.
+
+    """
+    assert os.environ["OMP_NUM_THREADS"] == "1"
+    assert config["mpi_np"] == "1"
+    harnesses = []
+    for folder, model_name, parameter in HISTORY_BASED_CASES:
+        model = copy.deepcopy(request.getfixturevalue(model_name))
+        model.settings.surf_source_write = parameter
+        harnesses.append(
+            SurfaceSourceWriteTestHarness("statepoint.5.h5", model=model, workdir=folder)
+        )
+
+    max_workers = max(os.cpu_count() // 2, 1)
+    with ProcessPoolExecutor(
+        max_workers,
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=_init_worker,
+        initargs=(harnesses,),
+    ) as executor:
+        futures = [executor.submit(_run_case, i) for i in range(len(harnesses))]
+
+    # Report all the failing cases rather than only the first one
+    failures = []
+    for (folder, _, _), future in zip(HISTORY_BASED_CASES, futures):
+        exc = future.exception()
+        if exc is not None:
+            failures.append(f"{folder}: {type(exc).__name__}: {exc}")
+    if failures:
+        pytest.fail(
+            f"{len(failures)} case(s) failed:\n" + "\n".join(failures),
+            pytrace=False,
+        )
+
+
 @pytest.mark.skipif(config["event"] is True, reason="Results from history-based mode.")
 def test_consistency_low_realization_number(model_1, two_threads, single_process):
     """The objective is to test that the results produced, in a case where
@@ -946,6 +989,36 @@ def model_dagmc_1():
     return model
 
 
+def _make_box(size, surface_ids, boundary_type="transmission"):
+    """Create the planes of a box centered on the origin and the region
+    inside of it.
+
+    Parameters
+    ----------
+    size : float
+        Length of the sides of the box
+    surface_ids : iterable of int
+        IDs of the lower and upper z-, x- and y-planes, in this order
+    boundary_type : str
+        Boundary conditions of the planes
+
+    Returns
+    -------
+    region : openmc.Intersection
+        Region inside of the box
+    halfspaces : list of openmc.Halfspace
+        Half-spaces whose intersection is the region inside of the box
+
+    """
+    ids = iter(surface_ids)
+    halfspaces = []
+    for plane_cls in (openmc.ZPlane, openmc.XPlane, openmc.YPlane):
+        lower = plane_cls(-size / 2.0, boundary_type=boundary_type, surface_id=next(ids))
+        upper = plane_cls(size / 2.0, boundary_type=boundary_type, surface_id=next(ids))
+        halfspaces += [+lower, -upper]
+    return functools.reduce(operator.and_, halfspaces), halfspaces
+
+
 @pytest.fixture(scope="module")
 def model_dagmc_2():
     """Model based on the mesh file 'dagmc.h5m' available from
@@ -990,23 +1063,8 @@ def model_dagmc_2():
     # Parameters
     box1_size = 44
 
-    # Surfaces
-    box1_lower_plane = openmc.ZPlane(-box1_size / 2.0, surface_id=101)
-    box1_upper_plane = openmc.ZPlane(box1_size / 2.0, surface_id=102)
-    box1_left_plane = openmc.XPlane(-box1_size / 2.0, surface_id=103)
-    box1_right_plane = openmc.XPlane(box1_size / 2.0, surface_id=104)
-    box1_rear_plane = openmc.YPlane(-box1_size / 2.0, surface_id=105)
-    box1_front_plane = openmc.YPlane(box1_size / 2.0, surface_id=106)
-
-    # Region
-    box1_region = (
-        +box1_lower_plane
-        & -box1_upper_plane
-        & +box1_left_plane
-        & -box1_right_plane
-        & +box1_rear_plane
-        & -box1_front_plane
-    )
+    # Surfaces and region
+    box1_region, box1_halfspaces = _make_box(box1_size, range(101, 107))
 
     # Cell
     box1 = openmc.Cell(fill=dagmc_univ, region=box1_region, cell_id=8)
@@ -1018,43 +1076,9 @@ def model_dagmc_2():
     # Parameters
     box2_size = 48
 
-    # Surfaces
-    box2_lower_plane = openmc.ZPlane(
-        -box2_size / 2.0, boundary_type="vacuum", surface_id=107
-    )
-    box2_upper_plane = openmc.ZPlane(
-        box2_size / 2.0, boundary_type="vacuum", surface_id=108
-    )
-    box2_left_plane = openmc.XPlane(
-        -box2_size / 2.0, boundary_type="vacuum", surface_id=109
-    )
-    box2_right_plane = openmc.XPlane(
-        box2_size / 2.0, boundary_type="vacuum", surface_id=110
-    )
-    box2_rear_plane = openmc.YPlane(
-        -box2_size / 2.0, boundary_type="vacuum", surface_id=111
-    )
-    box2_front_plane = openmc.YPlane(
-        box2_size / 2.0, boundary_type="vacuum", surface_id=112
-    )
-
-    # Region
-    inside_box2 = (
-        +box2_lower_plane
-        & -box2_upper_plane
-        & +box2_left_plane
-        & -box2_right_plane
-        & +box2_rear_plane
-        & -box2_front_plane
-    )
-    outside_box1 = (
-        -box1_lower_plane
-        | +box1_upper_plane
-        | -box1_left_plane
-        | +box1_right_plane
-        | -box1_rear_plane
-        | +box1_front_plane
-    )
+    # Surfaces and region
+    inside_box2, _ = _make_box(box2_size, range(107, 113), boundary_type="vacuum")
+    outside_box1 = functools.reduce(operator.or_, [~h for h in box1_halfspaces])
 
     box2_region = inside_box2 & outside_box1
 
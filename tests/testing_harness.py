@@ -33,8 +33,9 @@ def colorize(diff):
 class TestHarness:
     """General class for running OpenMC regression tests."""
 
-    def __init__(self, statepoint_name):
+    def __init__(self, statepoint_name, workdir=None):
         self._sp_name = statepoint_name
+        self.workdir = workdir
 
     def main(self):
         """Accept commandline arguments and either run or update tests."""
@@ -65,29 +66,37 @@ class TestHarness:
         finally:
             self._cleanup()
 
+    def _path(self, filename):
+        """Return the path of a file located in the working directory."""
+        if self.workdir is None:
+            return filename
+        return os.path.join(self.workdir, filename)
+
     def _run_openmc(self):
+        cwd = self.workdir if self.workdir is not None else '.'
         if config['mpi']:
             mpi_args = [config['mpiexec'], '-n', config['mpi_np']]
             openmc.run(openmc_exec=config['exe'], mpi_args=mpi_args,
-              event_based=config['event'])
+              event_based=config['event'], cwd=cwd)
         else:
-            openmc.run(openmc_exec=config['exe'], event_based=config['event'])
+            openmc.run(openmc_exec=config['exe'], event_based=config['event'],
+                       cwd=cwd)
 
     def _test_output_created(self):
         """Make sure statepoint.* and tallies.out have been created."""
-        statepoint = glob.glob(self._sp_name)
+        statepoint = glob.glob(self._path(self._sp_name))
         assert len(statepoint) == 1, 'Either multiple or no statepoint files' \
             ' exist.'
         assert statepoint[0].endswith('h5'), \
             'Statepoint file is not a HDF5 file.'
-        if os.path.exists('tallies.xml'):
-            assert os.path.exists('tallies.out'), \
+        if os.path.exists(self._path('tallies.xml')):
+            assert os.path.exists(self._path('tallies.out')), \
                 'Tally output file does not exist.'
 
     def _get_results(self, hash_output=False):
         """Digest info in the statepoint and return as a string."""
         # Read the statepoint file.
-        statepoint = glob.glob(self._sp_name)[0]
+        statepoint = glob.glob(self._path(self._sp_name))[0]
         with openmc.StatePoint(statepoint) as sp:
             outstr = ''
             if sp.run_mode == 'eigenvalue':
@@ -121,31 +130,34 @@ class TestHarness:
 
     def _write_results(self, results_string):
         """Write the results to an ASCII file."""
-        with open('results_test.dat', 'w') as fh:
+        with open(self._path('results_test.dat'), 'w') as fh:
             fh.write(results_string)
 
     def _overwrite_results(self):
         """Overwrite the results_true with the results_test."""
-        shutil.copyfile('results_test.dat', 'results_true.dat')
+        shutil.copyfile(self._path('results_test.dat'),
+                        self._path('results_true.dat'))
 
     def _compare_results(self):
         """Make sure the current results agree with the reference."""
-        compare = filecmp.cmp('results_test.dat', 'results_true.dat')
+        results_test = self._path('results_test.dat')
+        results_true = self._path('results_true.dat')
+        compare = filecmp.cmp(results_test, results_true)
         if not compare:
-            expected = open('results_true.dat').readlines()
-            actual = open('results_test.dat').readlines()
-            diff = unified_diff(expected, actual, 'results_true.dat',
-                                'results_test.dat')
+            expected = open(results_true).readlines()
+            actual = open(results_test).readlines()
+            diff = unified_diff(expected, actual, results_true, results_test)
             print('Result differences:')
             print(''.join(colorize(diff)))
-            os.rename('results_test.dat', 'results_error.dat')
+            os.rename(results_test, self._path('results_error.dat'))
         assert compare, 'Results do not agree'
 
     def _cleanup(self):
         """Delete statepoints, tally, and test files."""
-        output = glob.glob('statepoint.*.h5')
-        output += ['tallies.out', 'results_test.dat', 'summary.h5']
-        output += glob.glob('volume_*.h5')
+        output = glob.glob(self._path('statepoint.*.h5'))
+        output += [self._path(f) for f in
+                   ('tallies.out', 'results_test.dat', 'summary.h5')]
+        output += glob.glob(self._path('volume_*.h5'))
         for f in output:
             if os.path.exists(f):
                 os.remove(f)
@@ -287,8 +299,9 @@ class ParticleRestartTestHarness(TestHarness):
 
 
 class PyAPITestHarness(TestHarness):
-    def __init__(self, statepoint_name, model=None, inputs_true=None):
-        super().__init__(statepoint_name)
+    def __init__(self, statepoint_name, model=None, inputs_true=None,
+                 workdir=None):
+        super().__init__(statepoint_name, workdir)
         if model is None:
             self._model = pwr_core()
         else:
@@ -338,34 +351,36 @@ class PyAPITestHarness(TestHarness):
 
     def _build_inputs(self):
         """Write input XML files."""
-        self._model.export_to_model_xml()
+        self._model.export_to_model_xml(self._path('model.xml'))
 
     def _get_inputs(self):
         """Return a hash digest of the input XML files."""
-        xmls = ['model.xml', 'plots.xml']
+        xmls = [self._path('model.xml'), self._path('plots.xml')]
         return ''.join([open(fname).read() for fname in xmls
                         if os.path.exists(fname)])
 
     def _write_inputs(self, input_digest):
         """Write the digest of the input XMLs to an ASCII file."""
-        with open('inputs_test.dat', 'w') as fh:
+        with open(self._path('inputs_test.dat'), 'w') as fh:
             fh.write(input_digest)
 
     def _overwrite_inputs(self):
         """Overwrite inputs_true.dat with inputs_test.dat"""
-        shutil.copyfile('inputs_test.dat', self.inputs_true)
+        shutil.copyfile(self._path('inputs_test.dat'),
+                        self._path(self.inputs_true))
 
     def _compare_inputs(self):
         """Make sure the current inputs agree with the _true standard."""
-        compare = filecmp.cmp('inputs_test.dat', self.inputs_true)
+        inputs_test = self._path('inputs_test.dat')
+        inputs_true = self._path(self.inputs_true)
+        compare = filecmp.cmp(inputs_test, inputs_true)
         if not compare:
-            expected = open(self.inputs_true, 'r').readlines()
-            actual = open('inputs_test.dat', 'r').readlines()
-            diff = unified_diff(expected, actual, self.inputs_true,
-                                'inputs_test.dat')
+            expected = open(inputs_true, 'r').readlines()
+            actual = open(inputs_test, 'r').readlines()
+            diff = unified_diff(expected, actual, inputs_true, inputs_test)
             print('Input differences:')
             print(''.join(colorize(diff)))
-            os.rename('inputs_test.dat', 'inputs_error.dat')
+            os.rename(inputs_test, self._path('inputs_error.dat'))
         assert compare, 'Input files are broken.'
 
     def _cleanup(self):
@@ -373,7 +388,7 @@ class PyAPITestHarness(TestHarness):
         super()._cleanup()
         output = ['materials.xml', 'geometry.xml', 'settings.xml',
                   'tallies.xml', 'plots.xml', 'inputs_test.dat', 'model.xml']
-        for f in output:
+        for f in map(self._path, output):
             if os.path.exists(f):
                 os.remove(f)
 
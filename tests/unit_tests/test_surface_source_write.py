@@ -1,6 +1,7 @@
 """Test the 'surf_source_write' setting used to store particles that cross
 surfaces in a file for a given simulation."""
 
+import copy
 from pathlib import Path
 
 import openmc
@@ -34,13 +35,13 @@ def geometry():
         {"max_particles": 200, "surface_ids": [2], "cellfrom": 1},
     ],
 )
-def test_xml_serialization(parameter, run_in_tmpdir):
+def test_xml_serialization(parameter):
     """Check that the different use cases can be written and read in XML."""
     settings = openmc.Settings()
     settings.surf_source_write = parameter
-    settings.export_to_xml()
+    elem = settings.to_xml_element()
 
-    read_settings = openmc.Settings.from_xml()
+    read_settings = openmc.Settings.from_xml_element(elem)
     assert read_settings.surf_source_write == parameter
 
 
@@ -105,14 +106,32 @@ def model():
     return model
 
 
-@pytest.mark.parametrize(
-    "parameter",
-    [
+@pytest.fixture(
+    scope="module",
+    params=[
         {"max_particles": 200, "cellto": 2, "surface_ids": [2]},
         {"max_particles": 200, "cellfrom": 2, "surface_ids": [2]},
     ],
 )
-def test_particle_direction(parameter, run_in_tmpdir, model):
+def particle_direction_source(request, tmp_path_factory, model):
+    """Run the model once for each set of parameters and return the parameters
+    along with the source bank read from the surface source file."""
+    parameter = request.param
+
+    # Share the geometry and materials of the module model but not its settings
+    model = copy.copy(model)
+    model.settings = copy.deepcopy(model.settings)
+    model.settings.surf_source_write = parameter
+
+    cwd = tmp_path_factory.mktemp("surf_source_write")
+    model.run(cwd=cwd)
+    with h5py.File(cwd / "surface_source.h5", "r") as f:
+        source = f["source_bank"][:]
+
+    return parameter, source
+
+
+def test_particle_direction(particle_direction_source):
     """Test the direction of particles with the 'cellfrom' and 'cellto' parameters
     on a simple model with only one surface of interest.
 
@@ -120,24 +139,21 @@ def test_particle_direction(parameter, run_in_tmpdir, model):
     into two hemispheres.
 
     """
-    model.settings.surf_source_write = parameter
-    model.run()
-    with h5py.File("surface_source.h5", "r") as f:
-        source = f["source_bank"]
-
-        assert len(source) == 200
-
-        # We want to verify that the dot product of the surface's normal vector
-        # and the direction of the particle is either positive or negative
-        # depending on cellfrom or cellto. In this case, it is equivalent
-        # to just compare the z component of the direction of the particle.
-        for point in source:
-            if "cellto" in parameter.keys():
-                assert point["u"]["z"] > 0.0
-            elif "cellfrom" in parameter.keys():
-                assert point["u"]["z"] < 0.0
-            else:
-                assert False
+    parameter, source = particle_direction_source
+
+    assert len(source) == 200
+
+    # We want to verify that the dot product of the surface's normal vector
+    # and the direction of the particle is either positive or negative
+    # depending on cellfrom or cellto. In this case, it is equivalent
+    # to just compare the z component of the direction of the particle.
+    uz = source["u"]["z"]
+    if "cellto" in parameter.keys():
+        assert np.all(uz > 0.0)
+    elif "cellfrom" in parameter.keys():
+        assert np.all(uz < 0.0)
+    else:
+        assert False
 
 
 @pytest.fixture
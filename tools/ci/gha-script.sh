@@ -22,4 +22,10 @@ if [[ $NCRYSTAL = 'y' ]]; then
 fi
 
 # Run regression and unit tests
-pytest --cov=openmc -v $args tests
+pytest --cov=openmc -v $args tests \
+  --ignore=tests/regression_tests/surface_source_write
+
+# The surface source write cases run in their own folders with a single thread,
+# so they are distributed over several processes
+pytest --cov=openmc --cov-append -v $args -n auto \
+  tests/regression_tests/surface_source_write